@@ -79,7 +79,7 @@ def _prepare_shell(shell: PositronShell) -> None:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def kernel() -> PositronIPyKernel:
     """
     The Positron kernel, configured for testing purposes.
@@ -108,12 +108,23 @@ def kernel() -> PositronIPyKernel:
     return kernel
 
 
-@pytest.fixture
-def shell(kernel) -> Iterable[PositronShell]:
+@pytest.fixture(scope="session")
+def positron_shell(kernel: PositronIPyKernel) -> PositronShell:
+    """
+    The Positron shell, prepared once per session. Tests should use the `shell` fixture instead,
+    which also cleans up the user namespace after each test.
+    """
     shell = PositronShell.instance(parent=kernel)
 
     _prepare_shell(shell)
 
+    return shell
+
+
+@pytest.fixture
+def shell(positron_shell: PositronShell) -> Iterable[PositronShell]:
+    shell = positron_shell
+
     user_ns_keys = set(shell.user_ns.keys())
 
     yield shell
@@ -167,16 +178,31 @@ def variables_service(kernel: PositronIPyKernel) -> VariablesService:
     return kernel.variables_service
 
 
+@pytest.fixture(scope="session")
+def session_variables_comm() -> DummyComm:
+    """
+    The variables comm, opened once per session. Tests should use the `variables_comm` fixture
+    instead, which also resets the comm before each test.
+    """
+    return DummyComm("dummy_variables_comm")
+
+
 @pytest.fixture
-def variables_comm(variables_service: VariablesService) -> DummyComm:
+def variables_comm(
+    variables_service: VariablesService, session_variables_comm: DummyComm
+) -> DummyComm:
     """
     Convenience fixture for accessing the variables comm.
     """
-    # Open a comm
-    variables_comm = DummyComm("dummy_variables_comm")
-    variables_service.on_comm_open(variables_comm, {})
+    variables_comm = session_variables_comm
+
+    # (Re)connect the comm if the service isn't already using it e.g. on first use, or if a
+    # previous test opened a different comm.
+    service_comm = variables_service._comm
+    if service_comm is None or service_comm.comm is not variables_comm:
+        variables_service.on_comm_open(variables_comm, {})
 
-    # Clear messages due to the comm_open
+    # Clear messages due to the comm_open or previous tests
     variables_comm.messages.clear()
 
     return variables_comm
@@ -41,17 +41,23 @@ INT_CASES = [
 ]
 
 
-NUMPY_SCALAR_CASES = [
-    np.int8(1),
-    np.int16(1),
-    np.int32(1),
-    np.int64(1),
-    np.float16(1.0),
-    np.float32(1.0),
-    np.float64(1.0),
+NUMPY_SCALAR_DTYPES = [
+    np.int8,
+    np.int16,
+    np.int32,
+    np.int64,
+    np.float16,
+    np.float32,
+    np.float64,
 ]
 
 
+NUMPY_SCALARS_BY_DTYPE = {dtype: dtype(1) for dtype in NUMPY_SCALAR_DTYPES}
+
+
+NUMPY_SCALAR_CASES = list(NUMPY_SCALARS_BY_DTYPE.values())
+
+
 FLOAT_CASES = [
     float("-inf"),
     -sys.float_info.max,
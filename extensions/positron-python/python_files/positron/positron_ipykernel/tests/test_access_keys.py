@@ -3,6 +3,7 @@
 # Licensed under the Elastic License 2.0. See LICENSE.txt for license information.
 #
 
+import itertools
 import json
 import math
 from typing import Any
@@ -11,8 +12,8 @@ import numpy as np
 import pandas as pd
 import polars as pl
 import pytest
-from fastcore.foundation import L
 from positron_ipykernel.access_keys import decode_access_key, encode_access_key
+from positron_ipykernel.third_party import torch_
 
 from .data import (
     BOOL_CASES,
@@ -26,23 +27,25 @@ from .data import (
     TIMESTAMP_CASES,
 )
 
-try:
-    import torch  # type: ignore [reportMissingImports] for 3.12
-except ImportError:
-    torch = None
+
+ENCODABLE_CASES = tuple(
+    itertools.chain(
+        BOOL_CASES,
+        STRING_CASES,
+        INT_CASES,
+        NUMPY_SCALAR_CASES,
+        FLOAT_CASES,
+        COMPLEX_CASES,
+        BYTES_CASES,
+        RANGE_CASES,
+        TIMESTAMP_CASES,
+    )
+)
 
 
+# Qualify ids with the type so that e.g. 1, True, and numpy scalars of the same value stay distinct.
 @pytest.mark.parametrize(
-    "case",
-    BOOL_CASES
-    + STRING_CASES
-    + INT_CASES
-    + NUMPY_SCALAR_CASES
-    + FLOAT_CASES
-    + COMPLEX_CASES
-    + BYTES_CASES
-    + RANGE_CASES
-    + TIMESTAMP_CASES,
+    "case", ENCODABLE_CASES, ids=[f"{type(case).__name__}-{case!r}" for case in ENCODABLE_CASES]
 )
 def test_encode_decode_access_key(case: Any) -> None:
     """
@@ -63,7 +66,6 @@ def test_encode_decode_access_key(case: Any) -> None:
         bytearray(),
         [],
         set(),
-        L(),
         pd.DataFrame(),
         pd.Series(),
         pl.DataFrame(),
@@ -79,10 +81,24 @@ def test_encode_access_key_not_hashable_error(case: Any) -> None:
         encode_access_key(case)
 
 
+def test_encode_access_key_not_hashable_error_fastcore_list() -> None:
+    """
+    Encoding a fastcore list as an access key raises an error.
+    """
+    # Import fastcore in the test to avoid its import cost when collecting this module.
+    from fastcore.foundation import L
+
+    with pytest.raises(TypeError):
+        encode_access_key(L())
+
+
 @pytest.mark.parametrize(
     "case",
     [
-        torch.tensor([]) if torch else None,
+        pytest.param(
+            torch_.tensor([]) if torch_ else None,
+            marks=pytest.mark.skipif(torch_ is None, reason="torch is not installed"),
+        ),
         lambda x: x,
     ],
 )
@@ -104,7 +120,7 @@ def test_encode_access_key_not_implemented_error(case: Any) -> None:
     "type_name",
     [
         # for Python 3.12
-        "torch.Tensor" if torch else "None",
+        "torch.Tensor" if torch_ else "None",
         "function",
     ],
 )
@@ -14,7 +14,7 @@ from positron_ipykernel.help import HelpService, help
 from positron_ipykernel.help_comm import HelpBackendRequest, HelpFrontendEvent
 
 from .conftest import DummyComm
-from .utils import json_rpc_request
+from .utils import json_rpc_request, json_rpc_response
 
 TARGET_NAME = "target_name"
 
@@ -145,13 +145,6 @@ def test_handle_show_help_topic(
     )
     help_comm.handle_msg(msg)
 
-    assert help_comm.messages == [
-        {
-            "data": {"jsonrpc": "2.0", "result": True},
-            "metadata": None,
-            "buffers": None,
-            "msg_type": "comm_msg",
-        }
-    ]
+    assert help_comm.messages == [json_rpc_response(True)]
 
     mock_show_help.assert_called_once_with("logging")
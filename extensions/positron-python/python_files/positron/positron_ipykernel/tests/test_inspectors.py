@@ -6,10 +6,9 @@ import copy
 import datetime
 import inspect
 import pprint
-import random
 import string
 import types
-from typing import Any, Callable, Iterable, Optional, Tuple
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple, Type
 
 from shapely.geometry import Polygon
 import numpy as np
@@ -17,13 +16,13 @@ import geopandas
 import pandas as pd
 import polars as pl
 import pytest
-from fastcore.foundation import L
 
 from positron_ipykernel.inspectors import (
     PRINT_WIDTH,
     TRUNCATE_AT,
     get_inspector,
 )
+from positron_ipykernel.third_party import torch_
 from positron_ipykernel.utils import get_qualname
 from positron_ipykernel.variables_comm import VariableKind
 
@@ -34,18 +33,14 @@ from .data import (
     COMPLEX_CASES,
     FLOAT_CASES,
     INT_CASES,
-    NUMPY_SCALAR_CASES,
+    NUMPY_SCALAR_DTYPES,
+    NUMPY_SCALARS_BY_DTYPE,
     RANGE_CASES,
     STRING_CASES,
     TIMESTAMP_CASES,
 )
 from .utils import get_type_as_str
 
-try:
-    import torch  # type: ignore [reportMissingImports] for 3.12
-except ImportError:
-    torch = None
-
 
 def verify_inspector(
     value: Any,
@@ -165,8 +160,19 @@ def test_inspect_string(value: str) -> None:
     )
 
 
-def test_inspect_string_truncated() -> None:
-    value = "".join(random.choices(string.ascii_letters, k=(TRUNCATE_AT + 10)))
+@pytest.fixture
+def long_random_string() -> str:
+    """
+    A random string that is longer than the display truncation limit.
+    """
+    # Use a seeded numpy generator since it's vectorized and deterministic.
+    rng = np.random.default_rng(0)
+    alphabet = np.frombuffer(string.ascii_letters.encode("ascii"), dtype=np.uint8)
+    return rng.choice(alphabet, size=TRUNCATE_AT + 10).tobytes().decode("ascii")
+
+
+def test_inspect_string_truncated(long_random_string: str) -> None:
+    value = long_random_string
     length = len(value)
     verify_inspector(
         value=value,
@@ -197,17 +203,20 @@ def test_inspect_integer(value: int) -> None:
     )
 
 
-@pytest.mark.parametrize("value", NUMPY_SCALAR_CASES)
-def test_inspect_numpy_scalars(value: np.integer) -> None:
-    dtype = str(value.dtype)
+@pytest.mark.parametrize(
+    ("dtype", "dtype_name"),
+    [(dtype, np.dtype(dtype).name) for dtype in NUMPY_SCALAR_DTYPES],
+)
+def test_inspect_numpy_scalars(dtype: Type[np.generic], dtype_name: str) -> None:
+    value = NUMPY_SCALARS_BY_DTYPE[dtype]
     verify_inspector(
         value=value,
         length=0,
         is_truncated=False,
         display_value=str(value),
         kind=VariableKind.Number,
-        display_type=f"numpy.{dtype}",
-        type_info=f"numpy.{dtype}",
+        display_type=f"numpy.{dtype_name}",
+        type_info=f"numpy.{dtype_name}",
     )
 
 
@@ -303,9 +312,13 @@ def test_inspect_bytearray(value: bytearray) -> None:
 def test_inspect_bytearray_truncated() -> None:
     value = bytearray(TRUNCATE_AT * 2)
     length = len(value)
+    # Each byte is displayed as at least one character, so the first TRUNCATE_AT bytes are enough
+    # to build the truncated display value without stringifying the whole bytearray. This relies
+    # on the bytes not containing quotes, which would change the quoting of the repr.
+    display_value = str(value[:TRUNCATE_AT])[:TRUNCATE_AT]
     verify_inspector(
         value=value,
-        display_value=str(value)[:TRUNCATE_AT],
+        display_value=display_value,
         kind=VariableKind.Bytes,
         display_type=f"bytearray [{length}]",
         type_info="bytearray",
@@ -337,16 +350,19 @@ def test_inspect_memoryview() -> None:
 #
 
 
-@pytest.mark.parametrize("value", TIMESTAMP_CASES)
-def test_inspect_timestamp(value: datetime.datetime) -> None:
+@pytest.mark.parametrize(
+    ("value", "display_type", "type_info"),
+    [(value, type(value).__name__, get_qualname(value)) for value in TIMESTAMP_CASES],
+)
+def test_inspect_timestamp(value: datetime.datetime, display_type: str, type_info: str) -> None:
     verify_inspector(
         value=value,
         length=0,
         is_truncated=False,
         display_value=repr(value),
         kind=VariableKind.Other,
-        display_type=type(value).__name__,
-        type_info=get_qualname(value),
+        display_type=display_type,
+        type_info=type_info,
     )
 
 
@@ -374,6 +390,18 @@ def test_inspect_none(value: None) -> None:
 # Test Collections
 #
 
+
+def _expected_pformat(value: Any) -> str:
+    """
+    The expected (untruncated) display value of a collection.
+    """
+    # pprint formats empty collections the same as their repr.
+    if hasattr(value, "__len__") and len(value) == 0:
+        return repr(value)
+
+    return pprint.pformat(value, width=PRINT_WIDTH, compact=True)
+
+
 SET_CASES = [
     set(),
     set([None]),
@@ -392,7 +420,7 @@ def test_inspect_set(value: set) -> None:
     verify_inspector(
         value=value,
         is_truncated=False,
-        display_value=pprint.pformat(value, width=PRINT_WIDTH, compact=True),
+        display_value=_expected_pformat(value),
         kind=VariableKind.Collection,
         display_type=f"set {{{length}}}",
         type_info="set",
@@ -401,12 +429,20 @@ def test_inspect_set(value: set) -> None:
     )
 
 
-def test_inspect_set_truncated() -> None:
-    value = set(list(range(TRUNCATE_AT * 2)))
+@pytest.fixture
+def big_range_set() -> Set[int]:
+    """
+    A set whose display value is longer than the display truncation limit.
+    """
+    return set(range(TRUNCATE_AT * 2))
+
+
+def test_inspect_set_truncated(big_range_set: Set[int]) -> None:
+    value = big_range_set
     length = len(value)
     verify_inspector(
         value=value,
-        display_value=pprint.pformat(value, width=PRINT_WIDTH, compact=True)[:TRUNCATE_AT],
+        display_value=_expected_pformat(value)[:TRUNCATE_AT],
         kind=VariableKind.Collection,
         display_type=f"set {{{length}}}",
         type_info="set",
@@ -438,7 +474,7 @@ def test_inspect_list(value: list) -> None:
     verify_inspector(
         value=value,
         is_truncated=False,
-        display_value=pprint.pformat(value, width=PRINT_WIDTH, compact=True),
+        display_value=_expected_pformat(value),
         kind=VariableKind.Collection,
         display_type=f"list [{length}]",
         type_info="list",
@@ -448,12 +484,20 @@ def test_inspect_list(value: list) -> None:
     )
 
 
-def test_inspect_list_truncated() -> None:
-    value = list(range(TRUNCATE_AT * 2))
+@pytest.fixture
+def big_range_list() -> List[int]:
+    """
+    A list whose display value is longer than the display truncation limit.
+    """
+    return list(range(TRUNCATE_AT * 2))
+
+
+def test_inspect_list_truncated(big_range_list: List[int]) -> None:
+    value = big_range_list
     length = len(value)
     verify_inspector(
         value=value,
-        display_value=pprint.pformat(value, width=PRINT_WIDTH, compact=True)[:TRUNCATE_AT],
+        display_value=_expected_pformat(value)[:TRUNCATE_AT],
         kind=VariableKind.Collection,
         display_type=f"list [{length}]",
         type_info="list",
@@ -470,7 +514,7 @@ def test_inspect_range(value: range) -> None:
     verify_inspector(
         value=value,
         is_truncated=False,
-        display_value=pprint.pformat(value, width=PRINT_WIDTH, compact=True),
+        display_value=_expected_pformat(value),
         kind=VariableKind.Collection,
         display_type=f"range [{length}]",
         type_info="range",
@@ -478,26 +522,31 @@ def test_inspect_range(value: range) -> None:
     )
 
 
+# Items of fastcore lists, which are constructed in the test to avoid importing fastcore at
+# collection time.
 FASTCORE_LIST_CASES = [
-    L(),
-    L(NONE_CASES),
-    L(BOOL_CASES),
-    L(INT_CASES),
-    L(FLOAT_CASES),
-    L(COMPLEX_CASES),
-    L(BYTES_CASES),
-    L(BYTEARRAY_CASES),
-    L(STRING_CASES),
+    [],
+    NONE_CASES,
+    BOOL_CASES,
+    INT_CASES,
+    FLOAT_CASES,
+    COMPLEX_CASES,
+    BYTES_CASES,
+    BYTEARRAY_CASES,
+    STRING_CASES,
 ]
 
 
-@pytest.mark.parametrize("value", FASTCORE_LIST_CASES)
-def test_inspect_fastcore_list(value: L) -> None:
+@pytest.mark.parametrize("items", FASTCORE_LIST_CASES)
+def test_inspect_fastcore_list(items: list) -> None:
+    from fastcore.foundation import L
+
+    value = L(items)
     length = len(value)
     verify_inspector(
         value=value,
         is_truncated=False,
-        display_value=pprint.pformat(value, width=PRINT_WIDTH, compact=True),
+        display_value=_expected_pformat(value),
         kind=VariableKind.Collection,
         display_type=f"L [{length}]",
         type_info="fastcore.foundation.L",
@@ -540,7 +589,7 @@ def test_inspect_map(value: dict) -> None:
     verify_inspector(
         value=value,
         is_truncated=False,
-        display_value=pprint.pformat(value, width=PRINT_WIDTH, compact=True),
+        display_value=_expected_pformat(value),
         kind=VariableKind.Map,
         display_type=f"dict [{length}]",
         type_info="dict",
@@ -921,7 +970,11 @@ def test_get_child(value: Any, key: Any, expected: Any) -> None:
     ("value", "expected"),
     [
         (np.array([[1, 2, 3], [4, 5, 6]], dtype="int64"), 48),
-        (torch.Tensor([[1, 2, 3], [4, 5, 6]]) if torch else None, 24),
+        pytest.param(
+            torch_.Tensor([[1, 2, 3], [4, 5, 6]]) if torch_ else None,
+            24,
+            marks=pytest.mark.skipif(torch_ is None, reason="torch is not installed"),
+        ),
         (pd.Series([1, 2, 3, 4]), 32),
         (pl.Series([1, 2, 3, 4]), 32),
         (pd.DataFrame({"a": [1, 2], "b": ["3", "4"]}), 4),
@@ -930,7 +983,5 @@ def test_get_child(value: Any, key: Any, expected: Any) -> None:
     ],
 )
 def test_arrays_maps_get_size(value: Any, expected: int) -> None:
-    if value is None:
-        return
     inspector = get_inspector(value)
     assert inspector.get_size() == expected
@@ -12,12 +12,8 @@ import pandas as pd
 import polars as pl
 import pytest
 
-try:
-    import torch  # type: ignore [reportMissingImports] for 3.12
-except ImportError:
-    torch = None
-
 from positron_ipykernel.positron_ipkernel import PositronIPyKernel, PositronShell
+from positron_ipykernel.third_party import torch_
 from positron_ipykernel.ui import UiService
 from positron_ipykernel.utils import alias_home
 
@@ -107,8 +103,8 @@ def test_set_console_width(ui_comm: DummyComm) -> None:
     assert np.get_printoptions()["linewidth"] == width
     assert pd.get_option("display.width") is None
     assert pl.Config.state()["POLARS_TABLE_WIDTH"] == str(width)
-    if torch is not None:  # temporary workaround for Python 3.12
-        assert torch._tensor_str.PRINT_OPTS.linewidth == width
+    if torch_ is not None:  # temporary workaround for Python 3.12
+        assert torch_._tensor_str.PRINT_OPTS.linewidth == width
 
 
 def test_open_editor(ui_service: UiService, ui_comm: DummyComm) -> None:
@@ -21,7 +21,7 @@ from positron_ipykernel.positron_comm import JsonRpcErrorCode
 from positron_ipykernel.positron_ipkernel import PositronIPyKernel
 from positron_ipykernel.utils import JsonData, JsonRecord, not_none
 from positron_ipykernel.variables import VariablesService, _summarize_variable
-from positron_ipykernel.variables_comm import Variable
+from positron_ipykernel.variables_comm import Variable, VariableKind
 
 from .conftest import DummyComm, PositronShell
 from .utils import (
@@ -183,6 +183,28 @@ def test_change_detection_over_limit(shell: PositronShell, variables_comm: Dummy
     _assert_assigned(shell, big_array, variables_comm)
 
 
+def test_summarize_variable_inspector_error() -> None:
+    # If the inspector fails, the variable is still summarized with a fallback summary.
+    with patch("positron_ipykernel.variables.timestamp", return_value=0):
+        with patch("positron_ipykernel.variables.get_inspector", side_effect=Exception("error")):
+            summary = _summarize_variable("x", 0)
+
+    assert summary == Variable(
+        display_name="x",
+        display_value="int",
+        display_type="",
+        kind=VariableKind.Other,
+        type_info="",
+        access_key="",
+        length=0,
+        size=0,
+        has_children=False,
+        has_viewer=False,
+        is_truncated=False,
+        updated_time=0,
+    )
+
+
 def _do_list(variables_comm: DummyComm):
     msg = json_rpc_request("list", comm_id="dummy_comm_id")
     with patch("positron_ipykernel.variables.timestamp", return_value=0):
@@ -300,6 +322,10 @@ def _encode_path(path: List[Any]) -> List[JsonData]:
     return [encode_access_key(key) for key in path]
 
 
+# The encoded path of the `x` variable.
+X_PATH = _encode_path(["x"])
+
+
 @pytest.mark.asyncio
 async def test_clear(
     shell: PositronShell,
@@ -345,7 +371,7 @@ def test_delete(shell: PositronShell, variables_comm: DummyComm) -> None:
     assert "y" in shell.user_ns
 
     assert variables_comm.messages == [
-        json_rpc_response(_encode_path(["x"])),
+        json_rpc_response(X_PATH),
     ]
 
 
@@ -596,7 +622,7 @@ def _verify_inspect(
         # Check the inspected variable; children are checked separately below.
         expected_child = expected_child.copy()
         expected_child_children = expected_child.pop("children")
-        child_dict = child.dict(include=expected_child.keys() - {"children"})
+        child_dict = {key: getattr(child, key) for key in expected_child}
         assert child_dict == expected_child
 
         if expected_child_children:
@@ -613,11 +639,11 @@ def test_inspect_large_object(shell: PositronShell, variables_comm: DummyComm) -
     shell.user_ns["x"] = np.arange(BIG_ARRAY_LENGTH)
 
     # _do_inspect will raise an error if an update message was triggered.
-    _do_inspect(_encode_path(["x"]), variables_comm)
+    _do_inspect(X_PATH, variables_comm)
 
 
 def test_inspect_error(variables_comm: DummyComm) -> None:
-    path = _encode_path(["x"])
+    path = X_PATH
     msg = json_rpc_request("inspect", {"path": path}, comm_id="dummy_comm_id")
 
     variables_comm.handle_msg(msg, raise_errors=False)
@@ -637,7 +663,7 @@ def test_clipboard_format(shell: PositronShell, variables_comm: DummyComm) -> No
     msg = json_rpc_request(
         "clipboard_format",
         {
-            "path": _encode_path(["x"]),
+            "path": X_PATH,
             "format": "text/plain",
         },
         comm_id="dummy_comm_id",
@@ -648,7 +674,7 @@ def test_clipboard_format(shell: PositronShell, variables_comm: DummyComm) -> No
 
 
 def test_clipboard_format_error(variables_comm: DummyComm) -> None:
-    path = _encode_path(["x"])
+    path = X_PATH
     # TODO(pyright): We shouldn't need to cast; may be a pyright bug
     msg = json_rpc_request(
         "clipboard_format",
@@ -666,6 +692,12 @@ def test_clipboard_format_error(variables_comm: DummyComm) -> None:
     ]
 
 
+@pytest.fixture(scope="module")
+def tiny_df() -> pd.DataFrame:
+    # The view tests only pass the dataframe to a mocked data explorer service, so it can be shared.
+    return pd.DataFrame({"a": [0]})
+
+
 def _do_view(
     name: str,
     shell: PositronShell,
@@ -689,9 +721,10 @@ def test_view(
     shell: PositronShell,
     variables_comm: DummyComm,
     mock_dataexplorer_service: Mock,
+    tiny_df: pd.DataFrame,
 ) -> None:
     name = "dfx"
-    shell.user_ns[name] = pd.DataFrame({"a": [0]})
+    shell.user_ns[name] = tiny_df
 
     _do_view(name, shell, variables_comm, mock_dataexplorer_service)
 
@@ -700,6 +733,7 @@ def test_view_with_sqlalchemy_v1_3(
     shell: PositronShell,
     variables_comm: DummyComm,
     mock_dataexplorer_service: Mock,
+    tiny_df: pd.DataFrame,
     monkeypatch,
 ) -> None:
     # Simulate sqlalchemy<=1.3 where `sqlalchemy.Engine` does not exist.
@@ -709,13 +743,13 @@ def test_view_with_sqlalchemy_v1_3(
 
     # The view request should still work.
     name = "dfx"
-    shell.user_ns[name] = pd.DataFrame({"a": [0]})
+    shell.user_ns[name] = tiny_df
 
     _do_view(name, shell, variables_comm, mock_dataexplorer_service)
 
 
 def test_view_error(variables_comm: DummyComm) -> None:
-    path = _encode_path(["x"])
+    path = X_PATH
     msg = json_rpc_request("view", {"path": path}, comm_id="dummy_comm_id")
     variables_comm.handle_msg(msg, raise_errors=False)
 
@@ -729,10 +763,13 @@ def test_view_error(variables_comm: DummyComm) -> None:
 
 
 def test_view_error_when_pandas_not_loaded(
-    shell: PositronShell, variables_comm: DummyComm, mock_dataexplorer_service: Mock
+    shell: PositronShell,
+    variables_comm: DummyComm,
+    mock_dataexplorer_service: Mock,
+    tiny_df: pd.DataFrame,
 ) -> None:
     # regression test for https://github.com/posit-dev/positron/issues/3653
-    shell.user_ns["x"] = pd.DataFrame({"a": [0]})
+    shell.user_ns["x"] = tiny_df
 
     # Cases where the object has a viewer action, but no service reports it as
     # supported.
@@ -741,7 +778,7 @@ def test_view_error_when_pandas_not_loaded(
 
     mock_dataexplorer_service.is_supported = not_supported
 
-    path = _encode_path(["x"])
+    path = X_PATH
     msg = json_rpc_request("view", {"path": path}, comm_id="dummy_comm_id")
     variables_comm.handle_msg(msg, raise_errors=False)
 
@@ -781,7 +818,11 @@ def test_unknown_method(variables_comm: DummyComm) -> None:
 
 
 @pytest.mark.asyncio
-async def test_shutdown(variables_service: VariablesService, variables_comm: DummyComm) -> None:
+async def test_shutdown(variables_service: VariablesService) -> None:
+    # Use a dedicated comm since the shared `variables_comm` fixture is reused by other tests
+    variables_comm = DummyComm("dummy_variables_comm")
+    variables_service.on_comm_open(variables_comm, {})
+
     # Double-check that the comm is not yet closed
     assert not variables_comm._closed
 